@@ -1,9 +1,18 @@
 from flask import Flask
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
+from config import Config
+from json_provider import FastJSONProvider
+from compression import init_compression
 from routes import routes_bp, payment_bp  
 
 app = Flask(__name__)
+app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
+app.json = FastJSONProvider(app)
+app.config["COMPRESS_MIN_SIZE"] = Config.COMPRESS_MIN_SIZE
+app.config["MAX_CONTENT_LENGTH"] = Config.MAX_CONTENT_LENGTH
 CORS(app, resources={r"/api/*": {"origins": ["https://cusmartdining.netlify.app"]}})
+init_compression(app)
 
 app.register_blueprint(routes_bp, url_prefix="/api")
 app.register_blueprint(payment_bp, url_prefix="/api")  
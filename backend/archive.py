@@ -0,0 +1,170 @@
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import zstandard
+
+from config import Config
+
+ARCHIVE_DIR = Config.ARCHIVE_DIR
+ARCHIVE_AFTER_DAYS = Config.ARCHIVE_AFTER_DAYS
+ARCHIVE_BATCH_SIZE = 5000
+ZSTD_LEVEL = 10
+
+# Collection name -> field that uniquely identifies a document in its partition.
+ARCHIVED_COLLECTIONS = {"orders": "order_id", "feedback": "order_id"}
+
+MANIFEST_PATH = os.path.join(ARCHIVE_DIR, "manifest.json")
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"collections": {}}
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def save_manifest(manifest):
+    _write_atomic(MANIFEST_PATH, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def partition_path(collection, day):
+    return os.path.join(ARCHIVE_DIR, collection, day[:4], day[5:7], f"{collection}-{day}.ndjson.zst")
+
+
+def read_partition(path):
+    with open(path, "rb") as f:
+        raw = zstandard.ZstdDecompressor().stream_reader(f).read()
+    return [json.loads(line) for line in raw.splitlines() if line]
+
+
+def _write_partition(path, docs):
+    body = "".join(json.dumps(doc, default=str, separators=(",", ":")) + "\n" for doc in docs)
+    _write_atomic(path, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body.encode("utf-8")))
+
+
+def archive_collection(db, collection, key, before, manifest):
+    """Move documents created before ``before`` into per-day partitions.
+
+    Partitions are written and recorded in the manifest before the documents
+    are deleted, so an interrupted run leaves duplicates that the next run
+    merges by ``key`` rather than losing data.
+    """
+    hot = db[collection]
+    hot.create_index("created_at")
+    cutoff = before.isoformat()
+    entries = manifest["collections"].setdefault(collection, {"archived_before": None, "partitions": {}})
+    partitions = entries["partitions"]
+    moved = 0
+
+    while True:
+        batch = list(hot.find({"created_at": {"$lt": cutoff}}).sort("created_at", 1).limit(ARCHIVE_BATCH_SIZE))
+        if not batch:
+            break
+
+        by_day = {}
+        for doc in batch:
+            by_day.setdefault(str(doc["created_at"])[:10], []).append(doc)
+
+        for day, docs in by_day.items():
+            path = partition_path(collection, day)
+            merged = {}
+            if os.path.exists(path):
+                for doc in read_partition(path):
+                    merged[doc.get(key)] = doc
+            for doc in docs:
+                archived = {k: v for k, v in doc.items() if k != "_id"}
+                merged[archived.get(key)] = archived
+            rows = sorted(merged.values(), key=lambda d: str(d.get("created_at")))
+            _write_partition(path, rows)
+            partitions[day] = {
+                "file": os.path.relpath(path, ARCHIVE_DIR),
+                "count": len(rows),
+                "bytes": os.path.getsize(path),
+            }
+
+        entries["archived_before"] = max(entries["archived_before"] or "", cutoff)
+        save_manifest(manifest)
+
+        result = hot.delete_many({"_id": {"$in": [doc["_id"] for doc in batch]}})
+        moved += result.deleted_count
+        print(f"DEBUG: Archived {len(batch)} {collection} documents across {len(by_day)} day(s)")
+
+    return moved
+
+
+def run_archive(db, days=ARCHIVE_AFTER_DAYS, now=None):
+    now = now or datetime.utcnow()
+    before = datetime.combine((now - timedelta(days=days)).date(), datetime.min.time())
+    manifest = load_manifest()
+    return {
+        collection: archive_collection(db, collection, key, before, manifest)
+        for collection, key in ARCHIVED_COLLECTIONS.items()
+    }
+
+
+def _day_bounds(start, end):
+    start_iso = start.isoformat() if start else None
+    end_iso = (end + timedelta(days=1)).isoformat() if end else None
+    return start_iso, end_iso
+
+
+def find_in_range(db, collection, start=None, end=None, query=None):
+    """Return documents whose ``created_at`` falls on ``start``..``end``.
+
+    Both bounds are inclusive ``date`` objects and may be omitted. With
+    neither bound only the hot collection is scanned; otherwise archived
+    partitions are read for the days before the archive cutoff that the range
+    covers, from the earliest partition when ``start`` is omitted.
+    """
+    query = dict(query or {})
+    start_iso, end_iso = _day_bounds(start, end)
+    created_at = {}
+    if start_iso:
+        created_at["$gte"] = start_iso
+    if end_iso:
+        created_at["$lt"] = end_iso
+    if created_at:
+        query["created_at"] = created_at
+
+    key = ARCHIVED_COLLECTIONS[collection]
+    results = {}
+    if start or end:
+        entries = load_manifest()["collections"].get(collection, {})
+        archived_before = entries.get("archived_before")
+        if archived_before and (start_iso is None or start_iso < archived_before):
+            first_day = start.isoformat() if start else ""
+            last_day = end.isoformat() if end else archived_before[:10]
+            for day, partition in sorted(entries.get("partitions", {}).items()):
+                if not first_day <= day <= last_day:
+                    continue
+                for doc in read_partition(os.path.join(ARCHIVE_DIR, partition["file"])):
+                    if all(doc.get(k) == v for k, v in query.items() if k != "created_at"):
+                        results[doc.get(key)] = doc
+
+    # Hot documents win over archived copies left behind by an interrupted run.
+    for doc in db[collection].find(query, {"_id": 0}).sort("created_at", 1):
+        results[doc.get(key)] = doc
+    return sorted(results.values(), key=lambda d: str(d.get("created_at")))
+
+if __name__ == "__main__":
+    # Intended to run from cron, e.g. nightly: python archive.py [days]
+    from pymongo import MongoClient
+
+    client = MongoClient(Config.MONGO_URI)
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else ARCHIVE_AFTER_DAYS
+    moved = run_archive(client["smart_dining"], days)
+    for collection, count in moved.items():
+        print(f"{collection}: {count} documents archived")
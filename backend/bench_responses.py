@@ -0,0 +1,130 @@
+"""Benchmark the big list endpoints through the real app.
+
+Seeds an in-memory Mongo (mongomock) with synthetic orders, menu items and
+reservations, then requests each endpoint through ``app.test_client()`` with
+different ``Accept-Encoding`` headers. Reports the body bytes and
+``Content-Encoding`` of the actual responses, plus the time spent in the
+app's JSON provider and compression hook for the same payload.
+
+    pip install mongomock
+    python bench_responses.py
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+import jwt
+import mongomock
+import pymongo
+
+for name in ("TWILIO_ACCOUNT_SID", "TWILIO_AUTH_TOKEN", "TWILIO_PHONE_NUMBER", "CASHFREE_APP_ID", "CASHFREE_SECRET_KEY"):
+    os.environ.setdefault(name, "bench")
+pymongo.MongoClient = mongomock.MongoClient
+
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+import routes  # noqa: E402
+from app import app  # noqa: E402
+from compression import brotli, compress_response  # noqa: E402
+
+MENU = ["Burger", "Fries", "Ice Cream", "Noodles", "Pasta", "Pizza"]
+ENCODINGS = ["identity", "gzip"] + (["br", "gzip, deflate, br"] if brotli is not None else [])
+ENDPOINTS = ["/api/all-orders", "/api/food-items", "/api/all-reservations"]
+
+
+def seed(order_count, food_count, reservation_count):
+    for collection in (routes.orders_collection, routes.food_items_collection, routes.reservations_collection):
+        collection.delete_many({})
+
+    start = datetime.utcnow() - timedelta(days=20)
+    orders = []
+    for i in range(order_count):
+        items = [
+            {"id": random.randint(1, 6), "name": random.choice(MENU), "price": float(random.randint(40, 250)), "quantity": random.randint(1, 4)}
+            for _ in range(random.randint(1, 6))
+        ]
+        orders.append({
+            "order_id": f"ORDER_{random.randint(1000, 9999)}_{i}",
+            "items": items,
+            "amount": sum(item["price"] * item["quantity"] for item in items),
+            "phone_number": "9" + str(random.randint(10**8, 10**9 - 1)),
+            "status": random.choice(["PAID", "PENDING", "FAILED"]),
+            "created_at": (start + timedelta(seconds=i * 30)).isoformat(),
+            "email": f"student{i % 500}@chanakyauniversity.edu.in",
+        })
+    if orders:
+        routes.orders_collection.insert_many(orders)
+
+    routes.food_items_collection.insert_many([
+        {
+            "id": i + 1,
+            "name": f"{random.choice(MENU)} {i + 1}",
+            "price": float(random.randint(40, 250)),
+            "image": f"/images/{random.choice(MENU).lower().replace(' ', '')}.jpg",
+            "description": "Freshly made in the campus kitchen",
+            "created_at": start.isoformat(),
+        }
+        for i in range(food_count)
+    ])
+    routes.reservations_collection.insert_many([
+        {"table_number": i + 1, "user_name": f"Student {i + 1}", "phone_number": "9876543210"}
+        for i in range(reservation_count)
+    ])
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def encode_time(provider, payload, accept_encoding):
+    # Same work the app does after the route returns: jsonify, then the
+    # after_request compression hook.
+    def encode():
+        response = provider.response(payload)
+        return compress_response(response, app.config["COMPRESS_MIN_SIZE"])
+
+    with app.test_request_context(headers={"Accept-Encoding": accept_encoding}):
+        return best_of(encode)[0]
+
+
+def run(order_count, food_count=60, reservation_count=6):
+    seed(order_count, food_count, reservation_count)
+    client = app.test_client()
+    token = jwt.encode(
+        {"email": "bench@chanakyauniversity.edu.in", "isAdmin": True, "exp": datetime.utcnow() + timedelta(hours=1)},
+        routes.SECRET_KEY,
+        algorithm="HS256"
+    )
+    stdlib_provider = DefaultJSONProvider(app)
+
+    print(f"{order_count} orders, {food_count} food items, {reservation_count} reservations")
+    for endpoint in ENDPOINTS:
+        request_time, response = best_of(lambda: client.get(endpoint, headers={"Authorization": f"Bearer {token}", "Accept-Encoding": "identity"}))
+        payload = json.loads(response.data)
+        stdlib_time = encode_time(stdlib_provider, payload, "identity")
+        print(f"  {endpoint}  ({len(payload)} records, request {request_time * 1000:.1f} ms)")
+        print(f"    stdlib provider  {'identity':<18} {stdlib_time * 1000:8.2f} ms  {len(stdlib_provider.response(payload).get_data()):>10} bytes")
+
+        for accept_encoding in ENCODINGS:
+            with contextlib.redirect_stdout(io.StringIO()):
+                response = client.get(endpoint, headers={"Authorization": f"Bearer {token}", "Accept-Encoding": accept_encoding})
+            encoding = response.headers.get("Content-Encoding", "none")
+            elapsed = encode_time(app.json, payload, accept_encoding)
+            print(f"    app provider     {accept_encoding:<18} {elapsed * 1000:8.2f} ms  {len(response.data):>10} bytes  Content-Encoding: {encoding}")
+
+
+if __name__ == "__main__":
+    random.seed(42)
+    for count in (1000, 10000):
+        run(count)
@@ -0,0 +1,83 @@
+import gzip
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL_GZIP = 6
+COMPRESS_LEVEL_BROTLI = 5
+COMPRESS_MIMETYPES = {"application/json", "text/html", "text/plain", "text/css", "application/javascript"}
+
+
+def _accepted_encodings(header):
+    accepted = {}
+    for part in header.split(","):
+        pieces = part.strip().split(";")
+        name = pieces[0].strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in pieces[1:]:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def choose_encoding(header):
+    accepted = _accepted_encodings(header or "")
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress_body(data, encoding):
+    if encoding == "br":
+        return brotli.compress(data, quality=COMPRESS_LEVEL_BROTLI)
+    return gzip.compress(data, compresslevel=COMPRESS_LEVEL_GZIP)
+
+
+def compress_response(response, min_size=COMPRESS_MIN_SIZE):
+    if (
+        response.direct_passthrough
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESS_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+
+    encoding = choose_encoding(request.headers.get("Accept-Encoding"))
+    if encoding is None:
+        return response
+
+    data = response.get_data()
+    if len(data) < min_size:
+        return response
+
+    response.set_data(compress_body(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def init_compression(app):
+    app.config.setdefault("COMPRESS_MIN_SIZE", COMPRESS_MIN_SIZE)
+
+    @app.after_request
+    def _compress(response):
+        return compress_response(response, app.config["COMPRESS_MIN_SIZE"])
@@ -18,3 +18,15 @@ class Config:
     # Cashfree
     CASHFREE_APP_ID = config("CASHFREE_APP_ID")
     CASHFREE_SECRET_KEY = config("CASHFREE_SECRET_KEY")
+
+    # Response compression
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+
+    # Menu images. Point MENU_IMAGE_DIR at a persistent disk in production;
+    # the instance's own filesystem is wiped on every redeploy.
+    MENU_IMAGE_DIR = os.getenv("MENU_IMAGE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "media", "menu"))
+    MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH", 11 * 1024 * 1024))
+
+    # Order history archival
+    ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "archive"))
+    ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", 30))
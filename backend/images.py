@@ -0,0 +1,160 @@
+import hashlib
+import io
+import os
+import re
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from PIL import Image, ImageOps
+
+from config import Config
+
+IMAGE_DIR = Config.MENU_IMAGE_DIR
+IMAGE_WIDTHS = (160, 320, 640, 960)
+IMAGE_FORMATS = {"webp": ("WEBP", {"quality": 78, "method": 4}), "jpg": ("JPEG", {"quality": 80, "optimize": True, "progressive": True})}
+MAX_SOURCE_BYTES = 10 * 1024 * 1024
+MAX_SOURCE_PIXELS = 40_000_000
+FETCH_TIMEOUT = 10
+
+Image.MAX_IMAGE_PIXELS = MAX_SOURCE_PIXELS
+
+# Pillow releases the GIL while encoding, so a thread pool keeps every variant
+# of an upload in flight at once without forking workers.
+_executor = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2), thread_name_prefix="menu-image")
+
+
+class ImageIngestError(Exception):
+    pass
+
+
+def fetch_image(url):
+    try:
+        response = requests.get(url, timeout=FETCH_TIMEOUT, stream=True)
+    except requests.RequestException as e:
+        raise ImageIngestError(f"Could not download image: {e}")
+    if response.status_code != 200:
+        raise ImageIngestError(f"Could not download image: HTTP {response.status_code}")
+
+    data = bytearray()
+    for chunk in response.iter_content(64 * 1024):
+        data.extend(chunk)
+        if len(data) > MAX_SOURCE_BYTES:
+            response.close()
+            raise ImageIngestError("Image is too large")
+    return bytes(data)
+
+
+def variant_name(digest, width, ext):
+    return f"{digest}-{width}w.{ext}"
+
+
+def _open_source(data):
+    if len(data) > MAX_SOURCE_BYTES:
+        raise ImageIngestError("Image is too large")
+    try:
+        image = Image.open(io.BytesIO(data))
+        image.load()
+        image = ImageOps.exif_transpose(image)
+    except Exception as e:
+        raise ImageIngestError(f"Unsupported image: {e}")
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+    return image
+
+
+def _resize(source, width):
+    if source.width <= width:
+        return source
+    height = round(source.height * width / source.width)
+    return source.resize((width, height), Image.LANCZOS)
+
+
+def _write_variant(image, ext, path):
+    # ``image`` must not be shared with another save: Pillow keeps per-save
+    # encoder state on the image object.
+    pil_format, options = IMAGE_FORMATS[ext]
+    if pil_format == "JPEG" and image.mode != "RGB":
+        image = image.convert("RGB")
+
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    image.save(tmp_path, pil_format, **options)
+    os.replace(tmp_path, path)
+
+
+def ingest_image(data):
+    """Store resized WebP/JPEG variants of ``data`` under its content hash.
+
+    Returns the image record saved on the food item: the hash plus the widths
+    that were generated. Re-ingesting identical bytes reuses existing files.
+    """
+    digest = hashlib.sha256(data).hexdigest()[:20]
+    source = _open_source(data)
+    widths = [w for w in IMAGE_WIDTHS if w < source.width] + [min(source.width, IMAGE_WIDTHS[-1])]
+    widths = sorted(set(widths))
+
+    os.makedirs(IMAGE_DIR, exist_ok=True)
+    futures = []
+    for width in widths:
+        missing = [ext for ext in IMAGE_FORMATS if not os.path.exists(os.path.join(IMAGE_DIR, variant_name(digest, width, ext)))]
+        if not missing:
+            continue
+        resized = _resize(source, width)
+        for ext in missing:
+            path = os.path.join(IMAGE_DIR, variant_name(digest, width, ext))
+            futures.append(_executor.submit(_write_variant, resized.copy(), ext, path))
+    for future in futures:
+        future.result()
+
+    return {"hash": digest, "widths": widths}
+
+
+def variants_available(record):
+    """Whether the files for ``record`` are still on disk."""
+    digest = record["hash"]
+    return all(
+        os.path.exists(os.path.join(IMAGE_DIR, variant_name(digest, record["widths"][-1], ext)))
+        for ext in IMAGE_FORMATS
+    )
+
+
+def image_urls(record, url_for_variant):
+    """Build ``src``/``srcset`` values for a stored image record."""
+    digest = record["hash"]
+    widths = record["widths"]
+    urls = {}
+    for ext in IMAGE_FORMATS:
+        urls[ext] = ", ".join(f"{url_for_variant(variant_name(digest, w, ext))} {w}w" for w in widths)
+    fitting = [w for w in widths if w <= 640]
+    default_width = fitting[-1] if fitting else widths[0]
+    return {
+        "src": url_for_variant(variant_name(digest, default_width, "jpg")),
+        "srcset": urls["jpg"],
+        "srcset_webp": urls["webp"],
+    }
+
+
+if __name__ == "__main__":
+    # Ingest local images and point menu items that reference them by
+    # filename (e.g. "/images/pasta.jpg") at the generated variants.
+    from pymongo import MongoClient
+
+    client = MongoClient(Config.MONGO_URI)
+    food_items_collection = client["smart_dining"]["food_items"]
+
+    for path in sys.argv[1:]:
+        with open(path, "rb") as f:
+            data = f.read()
+        record = ingest_image(data)
+        name = os.path.basename(path)
+        result = food_items_collection.update_many(
+            {"image": {"$regex": f"(^|/){re.escape(name)}$"}},
+            {"$set": {"image_variants": record}}
+        )
+        client["smart_dining"]["menu_images"].update_one(
+            {"hash": record["hash"]},
+            {"$setOnInsert": {"hash": record["hash"], "data": data}},
+            upsert=True
+        )
+        print(f"{name}: {record['hash']} {record['widths']} ({result.modified_count} menu items updated)")
@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, redirect
+from flask import Blueprint, request, jsonify, redirect, send_from_directory, url_for
 from config import Config
 from pymongo import MongoClient
 from twilio.rest import Client
@@ -6,7 +6,7 @@ import bcrypt
 import requests
 import jwt
 import random
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from functools import wraps
 from flask_cors import CORS
 import smtplib
@@ -14,6 +14,9 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
 from dotenv import load_dotenv
+from archive import find_in_range
+from images import IMAGE_DIR, ImageIngestError, fetch_image, image_urls, ingest_image, variants_available
+from werkzeug.exceptions import RequestEntityTooLarge
 
 load_dotenv()
 
@@ -25,6 +28,9 @@ orders_collection = db["orders"]
 food_items_collection = db["food_items"]
 password_reset_tokens_collection = db["password_reset_tokens"]
 feedback_collection = db["feedback"]
+# Original menu image bytes, keyed by content hash. Variant files live on local
+# disk and are regenerated from here when a redeploy wipes them.
+menu_images_collection = db["menu_images"]
 
 twilio_client = Client(Config.TWILIO_ACCOUNT_SID, Config.TWILIO_AUTH_TOKEN)
 SECRET_KEY = Config.SECRET_KEY
@@ -294,21 +300,42 @@ def reset_password():
 @admin_required
 def add_food_item():
     try:
-        data = request.json
+        data = request.form if request.files or request.form else request.json
         name = data.get("name")
         price = data.get("price")
         image_url = data.get("image_url")
+        image_file = request.files.get("image")
         description = data.get("description", "")
 
-        print(f"DEBUG: Received data: {data}")
+        print(f"DEBUG: Received data: {dict(data)}")
 
         try:
             price = float(price)
         except (TypeError, ValueError):
             return jsonify({"success": False, "message": "Price must be a valid number"}), 400
 
-        if not name or price <= 0 or not image_url:
-            return jsonify({"success": False, "message": "Name, valid price, and image URL are required"}), 400
+        if image_url is not None and not isinstance(image_url, str):
+            image_url = None
+
+        if not name or price <= 0 or not (image_url or image_file):
+            return jsonify({"success": False, "message": "Name, valid price, and image upload or URL are required"}), 400
+
+        image_variants = None
+        try:
+            image_data = None
+            if image_file:
+                image_data = image_file.read()
+            elif image_url.startswith(("http://", "https://")):
+                image_data = fetch_image(image_url)
+            if image_data:
+                image_variants = ingest_image(image_data)
+                menu_images_collection.update_one(
+                    {"hash": image_variants["hash"]},
+                    {"$setOnInsert": {"hash": image_variants["hash"], "data": image_data}},
+                    upsert=True
+                )
+        except ImageIngestError as e:
+            return jsonify({"success": False, "message": str(e)}), 400
 
         existing_ids = [item.get("id") for item in food_items_collection.find({}, {"id": 1})]
         new_id = max(existing_ids or [0]) + 1
@@ -321,10 +348,14 @@ def add_food_item():
             "description": description,
             "created_at": datetime.utcnow().isoformat()
         }
+        if image_variants:
+            food_item["image_variants"] = image_variants
         food_items_collection.insert_one(food_item)
         print(f"DEBUG: Food item added: {food_item}")
 
         return jsonify({"success": True, "message": f"Food item '{name}' added successfully"}), 201
+    except RequestEntityTooLarge:
+        return jsonify({"success": False, "message": "Image upload is too large"}), 413
     except Exception as e:
         print(f"DEBUG: Error in add-food-item API: {str(e)}")
         return jsonify({"success": False, "message": "Server error", "error": str(e)}), 500
@@ -356,11 +387,35 @@ def remove_food_item():
 def get_food_items():
     try:
         food_items = list(food_items_collection.find({}, {"_id": 0}))
+        variant_url = lambda filename: url_for("routes.get_menu_image", filename=filename, _external=True)
+        missing = [item["image_variants"]["hash"] for item in food_items
+                   if item.get("image_variants") and not variants_available(item["image_variants"])]
+        restorable = {doc["hash"] for doc in menu_images_collection.find({"hash": {"$in": missing}}, {"hash": 1})} if missing else set()
+        for item in food_items:
+            variants = item.pop("image_variants", None)
+            if variants and (variants["hash"] in restorable or variants_available(variants)):
+                urls = image_urls(variants, variant_url)
+                item["image"] = urls["src"]
+                item.update(urls)
         return jsonify(food_items)
     except Exception as e:
         print(f"DEBUG: Error in get-food-items API: {str(e)}")
         return jsonify({"success": False, "message": "Server error", "error": str(e)}), 500
 
+@routes_bp.route("/images/<path:filename>", methods=["GET"])
+def get_menu_image(filename):
+    # Variant filenames embed a content hash, so a URL never changes meaning.
+    if not os.path.exists(os.path.join(IMAGE_DIR, filename)):
+        source = menu_images_collection.find_one({"hash": filename.split("-")[0]})
+        if source:
+            try:
+                ingest_image(source["data"])
+            except ImageIngestError as e:
+                print(f"DEBUG: Could not regenerate menu image {filename}: {str(e)}")
+    response = send_from_directory(IMAGE_DIR, filename, max_age=31536000)
+    response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
 @routes_bp.route("/signup", methods=["POST"])
 def signup():
     try:
@@ -467,16 +522,44 @@ def get_all_reservations():
         print(f"DEBUG: Error in get-all-reservations API: {str(e)}")
         return jsonify({"success": False, "message": "Server error", "error": str(e)}), 500
 
+def date_range_args():
+    start = request.args.get("from")
+    end = request.args.get("to")
+    return (
+        date.fromisoformat(start) if start else None,
+        date.fromisoformat(end) if end else None,
+    )
+
 @routes_bp.route("/all-orders", methods=["GET"])
 @token_required
 def get_all_orders():
     try:
-        orders = list(orders_collection.find({}, {"_id": 0}))
+        try:
+            start, end = date_range_args()
+        except ValueError:
+            return jsonify({"success": False, "message": "Dates must be in YYYY-MM-DD format"}), 400
+
+        orders = find_in_range(db, "orders", start, end)
         return jsonify(orders)
     except Exception as e:
         print(f"DEBUG: Error in get-all-orders API: {str(e)}")
         return jsonify({"success": False, "message": "Server error", "error": str(e)}), 500
 
+@routes_bp.route("/all-feedback", methods=["GET"])
+@admin_required
+def get_all_feedback():
+    try:
+        try:
+            start, end = date_range_args()
+        except ValueError:
+            return jsonify({"success": False, "message": "Dates must be in YYYY-MM-DD format"}), 400
+
+        feedback = find_in_range(db, "feedback", start, end)
+        return jsonify(feedback)
+    except Exception as e:
+        print(f"DEBUG: Error in get-all-feedback API: {str(e)}")
+        return jsonify({"success": False, "message": "Server error", "error": str(e)}), 500
+
 @routes_bp.route("/unreserve", methods=["POST"])
 @token_required
 def unreserve_table():
@@ -99,7 +99,20 @@ const FoodOrdering = () => {
           foodItems.map((item) => (
             <div key={item.id} className="food-item">
               <div className="food-item-image-container">
-                <img src={item.image} alt={item.name} className="food-image" />
+                <picture>
+                  {item.srcset_webp && (
+                    <source type="image/webp" srcSet={item.srcset_webp} sizes="(max-width: 600px) 100vw, 320px" />
+                  )}
+                  <img
+                    src={item.image}
+                    srcSet={item.srcset}
+                    sizes="(max-width: 600px) 100vw, 320px"
+                    alt={item.name}
+                    className="food-image"
+                    loading="lazy"
+                    decoding="async"
+                  />
+                </picture>
                 <div className="food-quick-add" onClick={() => addToCart(item)}>
                   <Plus size={20} />
                 </div>
@@ -134,7 +147,7 @@ const FoodOrdering = () => {
             <div className="cart-items">
               {cart.map((item) => (
                 <div key={item.id} className="cart-item">
-                  <img src={item.image} alt={item.name} className="cart-image" />
+                  <img src={item.image} srcSet={item.srcset} sizes="80px" alt={item.name} className="cart-image" />
                   <div className="cart-details">
                     <div className="cart-item-header">
                       <h3>{item.name}</h3>
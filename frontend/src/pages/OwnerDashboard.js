@@ -12,7 +12,7 @@ const OwnerDashboard = () => {
   const [foodItems, setFoodItems] = useState([]);
   const [isLoading, setIsLoading] = useState(true);
   const [lastClearedTimestamp, setLastClearedTimestamp] = useState(null);
-  const [foodItem, setFoodItem] = useState({ name: "", price: "", image_url: "", description: "" });
+  const [foodItem, setFoodItem] = useState({ name: "", price: "", image_url: "", image: null, description: "" });
   const navigate = useNavigate();
 
   const addFoodRef = useRef(null);
@@ -154,7 +154,7 @@ const OwnerDashboard = () => {
   const resetOrders = async () => {
     Swal.fire({
       title: 'Restore Orders?',
-      text: "This will reload all orders from the database, including old ones.",
+      text: "This will reload all recent orders from the database, including cleared ones. Older orders are kept in the archive.",
       icon: 'question',
       showCancelButton: true,
       confirmButtonColor: '#3085d6',
@@ -170,7 +170,7 @@ const OwnerDashboard = () => {
           localStorage.setItem("lastClearedTimestamp", initialTimestamp);
           Swal.fire(
             'Restored!',
-            'All orders have been reloaded from the database.',
+            'Recent orders have been reloaded from the database.',
             'success'
           );
         } catch (error) {
@@ -186,24 +186,34 @@ const OwnerDashboard = () => {
   };
 
   const handleFoodItemChange = (e) => {
-    const { name, value } = e.target;
-    setFoodItem((prev) => ({ ...prev, [name]: value }));
+    const { name, value, files } = e.target;
+    setFoodItem((prev) => ({ ...prev, [name]: files ? files[0] || null : value }));
   };
 
   const addFoodItem = async (e) => {
     e.preventDefault();
     try {
-      const payload = {
+      let payload = {
         ...foodItem,
         price: parseFloat(foodItem.price)
       };
-      const response = await axios.post("/add-food-item", payload);
+      if (foodItem.image) {
+        payload = new FormData();
+        payload.append("name", foodItem.name);
+        payload.append("price", foodItem.price);
+        payload.append("description", foodItem.description);
+        payload.append("image", foodItem.image);
+      }
+      const response = await axios.post("/add-food-item", payload, foodItem.image ? {
+        headers: { "Content-Type": "multipart/form-data" }
+      } : undefined);
       Swal.fire({
         icon: "success",
         title: "Success",
         text: response.data.message,
       });
-      setFoodItem({ name: "", price: "", image_url: "", description: "" });
+      setFoodItem({ name: "", price: "", image_url: "", image: null, description: "" });
+      e.target.reset();
       const foodItemsResponse = await axios.get("/food-items");
       setFoodItems(foodItemsResponse.data);
     } catch (error) {
@@ -397,10 +407,19 @@ const OwnerDashboard = () => {
                 name="image_url"
                 value={foodItem.image_url}
                 onChange={handleFoodItemChange}
-                required
+                required={!foodItem.image}
                 placeholder="https://example.com/image.jpg"
               />
             </div>
+            <div className="form-group">
+              <label>Or Upload Image:</label>
+              <input
+                type="file"
+                name="image"
+                accept="image/*"
+                onChange={handleFoodItemChange}
+              />
+            </div>
             <div className="form-group">
               <label>Description (Optional):</label>
               <input